@@ -1,17 +1,23 @@
 import asyncio
-import enum
 import sys
 from types import TracebackType
-from typing import Optional, Type, final
+from typing import Any, Coroutine, Dict, List, Optional, Type, cast, final
 
 
 __version__ = "5.0.1"
 
 
-__all__ = ("timeout", "timeout_at", "Timeout")
+__all__ = (
+    "timeout",
+    "timeout_at",
+    "Timeout",
+    "TimeoutStats",
+    "get_stats",
+    "reset_stats",
+)
 
 
-def timeout(delay: Optional[float]) -> "Timeout":
+def timeout(delay: Optional[float], *, name: Optional[str] = None) -> "Timeout":
     """timeout context manager.
 
     Useful in cases when you want to apply timeout logic around block
@@ -23,16 +29,21 @@ def timeout(delay: Optional[float]) -> "Timeout":
 
 
     delay - value in seconds or None to disable timeout logic
+
+    name - optional label, time spent in labeled blocks is
+    aggregated by get_stats()
     """
     loop = asyncio.get_running_loop()
     if delay is not None:
         deadline = loop.time() + delay  # type: Optional[float]
     else:
         deadline = None
-    return Timeout(deadline, loop)
+    return Timeout(deadline, loop, name)
 
 
-def timeout_at(deadline: Optional[float]) -> "Timeout":
+def timeout_at(
+    deadline: Optional[float], *, name: Optional[str] = None
+) -> "Timeout":
     """Schedule the timeout at absolute time.
 
     deadline argument points on the time in the same clock system
@@ -48,14 +59,84 @@ def timeout_at(deadline: Optional[float]) -> "Timeout":
 
     """
     loop = asyncio.get_running_loop()
-    return Timeout(deadline, loop)
+    return Timeout(deadline, loop, name)
+
+
+class TimeoutStats:
+    """Aggregated statistics for timeout blocks sharing the same name."""
+
+    # A plain slotted class, NamedTuple costs too much on import
+    __slots__ = ("calls", "expired", "total", "max")
+
+    def __init__(self, calls: int, expired: int, total: float, max: float) -> None:
+        self.calls = calls
+        self.expired = expired
+        self.total = total
+        self.max = max
+
+    @property
+    def expiry_rate(self) -> float:
+        return self.expired / self.calls if self.calls else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"<TimeoutStats calls={self.calls} expired={self.expired} "
+            f"total={self.total} max={self.max}>"
+        )
+
+
+# Names above the limit are aggregated under _STATS_OVERFLOW,
+# dynamically built names (e.g. containing request ids)
+# should not grow the table forever.
+_STATS_MAX_NAMES = 1000
+_STATS_OVERFLOW = "<overflow>"
+
+# name -> [calls, expired, total, max]
+# A dict of small lists instead of a packed array.array table:
+# rows are updated in place on every exit, array items would be
+# boxed and unboxed on each access and require an extra import.
+_stats = {}  # type: Dict[str, List[float]]
+
+
+def _record(name: str, duration: float, expired: bool) -> None:
+    row = _stats.get(name)
+    if row is None:
+        if len(_stats) >= _STATS_MAX_NAMES:
+            name = _STATS_OVERFLOW
+            row = _stats.get(name)
+        if row is None:
+            row = _stats[name] = [0, 0, 0.0, 0.0]
+    row[0] += 1
+    if expired:
+        row[1] += 1
+    row[2] += duration
+    if duration > row[3]:
+        row[3] = duration
+
+
+def get_stats() -> "Dict[str, TimeoutStats]":
+    """Return a snapshot of statistics collected for named timeouts.
+
+    Durations are measured by loop.time() from entering
+    to exiting the context manager.
+
+    At most 1000 distinct names are tracked, timeouts with other names
+    are aggregated under the "<overflow>" key.
+
+    Statistics are shared by all event loops but not protected by a lock,
+    counters can be inaccurate if loops run in several threads.
+    """
+    # Copy first: other threads may add names or update rows meanwhile
+    rows = [(name, tuple(row)) for name, row in list(_stats.items())]
+    return {
+        name: TimeoutStats(int(row[0]), int(row[1]), row[2], row[3])
+        for name, row in rows
+    }
 
 
-class _State(enum.Enum):
-    INIT = "INIT"
-    ENTER = "ENTER"
-    TIMEOUT = "TIMEOUT"
-    EXIT = "EXIT"
+def reset_stats() -> None:
+    """Drop all statistics collected for named timeouts."""
+    _stats.clear()
 
 
 if sys.version_info >= (3, 11):
@@ -84,9 +165,40 @@ if sys.version_info >= (3, 11):
         # Also provides several asyncio_timeout specific methods
         # for backward compatibility.
         def __init__(
-            self, deadline: Optional[float], loop: asyncio.AbstractEventLoop
+            self,
+            deadline: Optional[float],
+            loop: asyncio.AbstractEventLoop,
+            name: Optional[str] = None,
         ) -> None:
             super().__init__(deadline)
+            self._loop = loop
+            self._name = name
+
+        # Plain functions returning the asyncio.Timeout coroutines:
+        # unnamed timeouts don't pay for an extra coroutine per block.
+        def __aenter__(self) -> "Coroutine[Any, Any, Timeout]":
+            if self._name is not None:
+                self._started = self._loop.time()
+            # asyncio.Timeout.__aenter__ returns self
+            return cast("Coroutine[Any, Any, Timeout]", super().__aenter__())
+
+        def __aexit__(
+            self,
+            exc_type: Optional[Type[BaseException]],
+            exc_val: Optional[BaseException],
+            exc_tb: Optional[TracebackType],
+        ) -> "Coroutine[Any, Any, None]":
+            if self._name is not None:
+                _record(
+                    self._name,
+                    self._loop.time() - self._started,
+                    super().expired(),
+                )
+            return super().__aexit__(exc_type, exc_val, exc_tb)
+
+        @property
+        def name(self) -> Optional[str]:
+            return self._name
 
         @property
         def expired(self) -> _Expired:
@@ -131,6 +243,13 @@ if sys.version_info >= (3, 11):
             self.reschedule(deadline)
 
 else:
+    import enum
+
+    class _State(enum.Enum):
+        INIT = "INIT"
+        ENTER = "ENTER"
+        TIMEOUT = "TIMEOUT"
+        EXIT = "EXIT"
 
     @final
     class Timeout:
@@ -151,13 +270,26 @@ else:
         # The purpose is to time out as soon as possible
         # without waiting for the next await expression.
 
-        __slots__ = ("_deadline", "_loop", "_state", "_timeout_handler", "_task")
+        __slots__ = (
+            "_deadline",
+            "_loop",
+            "_state",
+            "_timeout_handler",
+            "_task",
+            "_name",
+            "_started",
+        )
 
         def __init__(
-            self, deadline: Optional[float], loop: asyncio.AbstractEventLoop
+            self,
+            deadline: Optional[float],
+            loop: asyncio.AbstractEventLoop,
+            name: Optional[str] = None,
         ) -> None:
             self._loop = loop
             self._state = _State.INIT
+            self._name = name
+            self._started = 0.0
 
             self._task: Optional["asyncio.Task[object]"] = None
             self._timeout_handler = None  # type: Optional[asyncio.Handle]
@@ -188,6 +320,10 @@ else:
         def deadline(self) -> Optional[float]:
             return self._deadline
 
+        @property
+        def name(self) -> Optional[str]:
+            return self._name
+
         def reject(self) -> None:
             """Reject scheduled timeout if any."""
             # cancel is maybe better name but
@@ -255,9 +391,17 @@ else:
             if self._state != _State.INIT:
                 raise RuntimeError(f"invalid state {self._state.value}")
             self._state = _State.ENTER
+            if self._name is not None:
+                self._started = self._loop.time()
             self._reschedule()
 
         def _do_exit(self, exc_type: Optional[Type[BaseException]]) -> None:
+            if self._name is not None:
+                _record(
+                    self._name,
+                    self._loop.time() - self._started,
+                    self._state == _State.TIMEOUT,
+                )
             if exc_type is asyncio.CancelledError and self._state == _State.TIMEOUT:
                 assert self._task is not None
                 self._timeout_handler = None
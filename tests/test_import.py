@@ -0,0 +1,103 @@
+import os
+import platform
+import subprocess
+import sys
+from pathlib import Path
+from typing import List, Tuple
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# The import cost guard counts Python calls made while the async_timeout
+# module body runs, it is not a timing benchmark: call counts do not depend
+# on machine load. They do depend on the interpreter, typing subscriptions
+# are much more expensive before 3.11, so the budget is the count of
+# the 5.0.1 module body on the same minor version (measured on
+# CPython 3.8.18-3.13.0) plus some slack.
+# -X importtime is used only to list the modules imported by async_timeout.
+BASELINE_CALLS = {
+    (3, 8): 241,
+    (3, 9): 259,
+    (3, 10): 274,
+    (3, 11): 89,
+    (3, 12): 83,
+    (3, 13): 95,
+}
+CALLS_SLACK = 20
+
+
+_SCRIPT = """\
+import os
+import sys
+import asyncio
+
+
+def count_calls(func, filename):
+    calls = 0
+
+    def profile(frame, event, arg):
+        nonlocal calls
+        if event != "call":
+            return
+        while frame is not None:
+            code = frame.f_code
+            if code.co_name == "<module>" and code.co_filename.endswith(filename):
+                calls += 1
+                return
+            frame = frame.f_back
+
+    sys.setprofile(profile)
+    try:
+        func()
+    finally:
+        sys.setprofile(None)
+    return calls
+
+
+module_file = os.path.join("async_timeout", "__init__.py")
+print(count_calls(lambda: __import__("async_timeout"), module_file))
+print(hasattr(sys.modules["async_timeout"], "_State"))
+"""
+
+
+def _import_async_timeout() -> Tuple[int, bool, List[str]]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [str(ROOT), env.get("PYTHONPATH")])
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _SCRIPT],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=ROOT,
+        env=env,
+    )
+    calls, has_state = proc.stdout.splitlines()
+    imported: List[str] = []
+    for line in proc.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].strip() == "asyncio":
+            imported = []
+        elif len(fields) == 3:
+            imported.append(fields[2].strip())
+    return int(calls), has_state == "True", imported
+
+
+@pytest.mark.skipif(
+    platform.python_implementation() != "CPython",
+    reason="-X importtime output and profiler call counts are CPython specific",
+)
+def test_import_cost() -> None:
+    calls, has_state, imported = _import_async_timeout()
+    # everything async_timeout needs is already loaded by asyncio
+    assert imported == ["async_timeout"]
+    # the state enum is used by the pre-3.11 implementation only
+    assert has_state == (sys.version_info < (3, 11))
+    baseline = BASELINE_CALLS.get(sys.version_info[:2])
+    if baseline is None:
+        pytest.skip("no 5.0.1 baseline for this Python version")
+    assert calls <= baseline + CALLS_SLACK
@@ -1,12 +1,14 @@
 import asyncio
 import sys
+import threading
 import time
 from functools import wraps
-from typing import Any, Callable, List, TypeVar
+from typing import Any, Callable, Iterator, List, TypeVar
 
 import pytest
 
-from async_timeout import timeout, timeout_at
+import async_timeout
+from async_timeout import get_stats, reset_stats, timeout, timeout_at
 
 
 _Func = TypeVar("_Func", bound=Callable[..., Any])
@@ -23,6 +25,13 @@ def log_func(func: _Func, msg: str, call_order: List[str]) -> _Func:
     return wrapper  # type: ignore[return-value]
 
 
+@pytest.fixture(autouse=True)
+def clean_stats() -> Iterator[None]:
+    reset_stats()
+    yield
+    reset_stats()
+
+
 @pytest.mark.asyncio
 async def test_timeout() -> None:
     canceled_raised = False
@@ -408,3 +417,140 @@ async def test_enter_twice() -> None:
     ):
         async with t:
             await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_name() -> None:
+    async with timeout(10, name="db.query") as t:
+        assert t.name == "db.query"
+    async with timeout(10) as t:
+        assert t.name is None
+
+
+@pytest.mark.asyncio
+async def test_unnamed_timeout_not_tracked() -> None:
+    async with timeout(10):
+        await asyncio.sleep(0)
+    with pytest.raises(asyncio.TimeoutError):
+        async with timeout(0.01):
+            await asyncio.sleep(10)
+    async with timeout_at(None):
+        await asyncio.sleep(0)
+    assert get_stats() == {}
+
+
+@pytest.mark.asyncio
+async def test_stats() -> None:
+    async with timeout(10, name="db.query"):
+        await asyncio.sleep(0.01)
+    with pytest.raises(asyncio.TimeoutError):
+        async with timeout_at(asyncio.get_running_loop().time(), name="db.query"):
+            await asyncio.sleep(10)
+    async with timeout(10):
+        await asyncio.sleep(0)
+
+    stats = get_stats()
+    assert list(stats) == ["db.query"]
+    st = stats["db.query"]
+    assert st.calls == 2
+    assert st.expired == 1
+    assert st.expiry_rate == 0.5
+    assert st.total >= st.max >= 0.01
+
+    reset_stats()
+    assert get_stats() == {}
+
+
+@pytest.mark.asyncio
+async def test_stats_inner_error() -> None:
+    with pytest.raises(ZeroDivisionError):
+        async with timeout(10, name="calc"):
+            1 / 0
+    st = get_stats()["calc"]
+    assert st.calls == 1
+    assert st.expired == 0
+    assert st.expiry_rate == 0.0
+
+
+@pytest.mark.asyncio
+async def test_stats_no_deadline() -> None:
+    async with timeout(None, name="no.deadline") as t:
+        await asyncio.sleep(0)
+    assert not t.expired
+    st = get_stats()["no.deadline"]
+    assert st.calls == 1
+    assert st.expired == 0
+
+
+@pytest.mark.asyncio
+async def test_stats_shift_and_reject() -> None:
+    with pytest.raises(asyncio.TimeoutError):
+        async with timeout(10, name="shifted") as t:
+            t.shift(-10)
+            await asyncio.sleep(10)
+    async with timeout(0.01, name="rejected") as t:
+        t.reject()
+        await asyncio.sleep(0.02)
+    assert not t.expired
+
+    stats = get_stats()
+    assert stats["shifted"].calls == 1
+    assert stats["shifted"].expired == 1
+    assert stats["rejected"].calls == 1
+    assert stats["rejected"].expired == 0
+    assert stats["rejected"].max >= 0.02
+
+
+@pytest.mark.asyncio
+async def test_stats_enter_twice() -> None:
+    async with timeout(10, name="twice") as t:
+        await asyncio.sleep(0)
+
+    with pytest.raises(RuntimeError):
+        async with t:
+            await asyncio.sleep(0)
+    assert get_stats()["twice"].calls == 1
+
+
+@pytest.mark.asyncio
+async def test_stats_max_names(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(async_timeout, "_STATS_MAX_NAMES", 2)
+    for i in range(5):
+        async with timeout(10, name=f"call.{i}"):
+            pass
+    async with timeout(10, name="call.0"):
+        pass
+
+    stats = get_stats()
+    assert list(stats) == ["call.0", "call.1", "<overflow>"]
+    assert stats["call.0"].calls == 2
+    assert stats["<overflow>"].calls == 3
+
+
+
+def test_get_stats_while_recording(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(async_timeout, "_STATS_MAX_NAMES", 100_000)
+    done = threading.Event()
+
+    async def record() -> None:
+        for i in range(5_000):
+            async with timeout(10, name=f"thread.{i}"):
+                pass
+
+    def run() -> None:
+        try:
+            asyncio.run(record())
+        finally:
+            done.set()
+
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    thread = threading.Thread(target=run)
+    thread.start()
+    try:
+        while not done.is_set():
+            get_stats()
+    finally:
+        thread.join()
+        sys.setswitchinterval(switch_interval)
+    assert len(get_stats()) == 5_000